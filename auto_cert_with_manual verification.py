@@ -1,18 +1,17 @@
-import io
+import logging
 import os
-import re
 import tkinter as tk
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from functools import lru_cache
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 import fitz  # PyMuPDF
-from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.pdfmetrics import stringWidth
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
-from PyPDF2 import PdfReader, PdfWriter
+
+from certificate_renderer import CertificateEntry, ensure_font_registered, init_worker, write_certificates
 
 
 THEMES = {
@@ -42,11 +41,74 @@ THEMES = {
     },
 }
 
+log = logging.getLogger(__name__)
+
 FONT_FAMILY = "Segoe UI"
+MAX_RASTER_WIDTH = 1200
+MAX_RASTER_HEIGHT = 900
+SELECTION_MAX_WIDTH = 1200
+SELECTION_MAX_HEIGHT = 800
+COMBINED_FILENAME = "certificates.pdf"
+# Failed exports named individually in the summary dialog; the rest are only counted.
+MAX_LISTED_FAILURES = 10
+FONT_EXTENSIONS = frozenset({"ttf", "otf"})
+# Characters Windows forbids in file names, each mapped to an underscore
+FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[\\/:\*\?\"<>\|]", "_", name)
+    return name.translate(FILENAME_TRANSLATION)
+
+
+@lru_cache(maxsize=4096)
+def cached_string_width(text: str, font_name: str, size: float) -> float:
+    """Memoized ReportLab stringWidth; widths only depend on the text, the registered font and the size."""
+
+    return stringWidth(text, font_name, size)
+
+
+@lru_cache(maxsize=128)
+def get_pil_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a preview font once per (path, size) instead of re-parsing the TTF on every redraw."""
+
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=256)
+def render_text_layer(font_path: str, size: int, text: str) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Rasterize white text onto a transparent image cropped to its bounding box.
+
+    Returns the layer and its offset from the text's left baseline point. Layers are cached, so
+    revisiting a font size or offset skips FreeType entirely; callers must not modify them.
+    """
+
+    pil_font = get_pil_font(font_path, size)
+    left, top, right, bottom = pil_font.getbbox(text, anchor="ls")
+    layer = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+    ImageDraw.Draw(layer).text((-left, -top), text, font=pil_font, fill=(255, 255, 255, 255), anchor="ls")
+    return layer, (left, top)
+
+
+def scan_font_files(fonts_dir: str) -> List[Tuple[str, str]]:
+    """Collect (label, path) for every TTF/OTF below fonts_dir using os.scandir."""
+
+    found: List[Tuple[str, str]] = []
+    pending = [fonts_dir]
+    while pending:
+        current_dir = pending.pop()
+        family = os.path.basename(current_dir)
+        subdirs = []
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                    continue
+                stem, _, extension = entry.name.rpartition(".")
+                if stem and extension.lower() in FONT_EXTENSIONS:
+                    font_label = f"{family}/{stem}" if family != "fonts" else stem
+                    found.append((font_label, entry.path))
+        pending.extend(reversed(subdirs))
+    return found
 
 
 def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
@@ -60,6 +122,8 @@ def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
     style.configure("Heading.TLabel", background=palette["card"], foreground=palette["text"], font=(FONT_FAMILY, 14, "bold"))
     style.configure("Emphasis.TLabel", background=palette["card"], foreground=palette["accent"], font=(FONT_FAMILY, 11, "bold"))
     style.configure("Status.TLabel", background=palette["card"], foreground=palette["muted"], font=(FONT_FAMILY, 10))
+    style.configure("Card.TCheckbutton", background=palette["card"], foreground=palette["text"], font=(FONT_FAMILY, 11))
+    style.map("Card.TCheckbutton", background=[("active", palette["card"])])
 
     style.configure("Title.TLabel", background=palette["bg"], foreground=palette["text"], font=(FONT_FAMILY, 24, "bold"))
     style.configure("Subtitle.TLabel", background=palette["bg"], foreground=palette["muted"], font=(FONT_FAMILY, 11))
@@ -93,6 +157,229 @@ def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
     root.option_add("*TCombobox*Listbox*Foreground", palette["text"])
 
 
+class ReviewWindow:
+    """Manual review dialog with live preview, built once per review session and reused for every name."""
+
+    def __init__(self, app: "CertificateApp") -> None:
+        self.app = app
+        self.name_text = ""
+        self.result: dict = {}
+        self.decision = tk.StringVar()
+        self.preview_pending = False
+        self.last_rendered: Optional[Tuple[str, str, int, int, int]] = None
+        # Last font in the dialog that parsed successfully
+        self.confirmed_font = ""
+        self.text_layer: Optional[Image.Image] = None
+        self.text_photo: Optional[ImageTk.PhotoImage] = None
+        palette = app.palette
+        rect_info = app.rect_info
+
+        self.window = window = tk.Toplevel(app.root)
+        window.configure(bg=palette["card"], padx=12, pady=12)
+        window.columnconfigure(0, weight=1)
+        window.columnconfigure(1, weight=0)
+        window.rowconfigure(0, weight=1)
+
+        preview_bg, self.preview_scale = app.review_background
+        preview_photo = ImageTk.PhotoImage(preview_bg)
+
+        # The template stays in one static canvas item; only the small text layer above it changes per tick.
+        preview_frame = tk.Frame(window, bd=2, relief="sunken")
+        preview_frame.grid(row=0, column=0, rowspan=6, sticky="nsew", padx=(0, 12))
+        self.preview_canvas = tk.Canvas(
+            preview_frame, width=preview_bg.width, height=preview_bg.height, bd=0, highlightthickness=0
+        )
+        self.preview_canvas.pack()
+        self.preview_canvas.create_image(0, 0, anchor="nw", image=preview_photo)
+        self.text_item = self.preview_canvas.create_image(0, 0, anchor="nw")
+        self.preview_photo = preview_photo
+
+        controls_frame = ttk.Frame(window, style="Card.TFrame")
+        controls_frame.grid(row=0, column=1, sticky="n")
+        controls_frame.columnconfigure(1, weight=1)
+
+        button_frame = ttk.Frame(controls_frame, style="Card.TFrame")
+        button_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 8))
+
+        self.font_var = tk.StringVar()
+        self.size_var = tk.IntVar(value=5)
+        x_offset_limit = int(max(10, rect_info["rect_width"] / 2))
+        y_offset_limit = int(max(10, rect_info["rect_height"] / 2))
+        self.x_offset_var = tk.DoubleVar(value=0)
+        self.y_offset_var = tk.DoubleVar(value=0)
+
+        ttk.Label(controls_frame, text="Font", style="Card.TLabel").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        self.font_selector = ttk.Combobox(
+            controls_frame,
+            textvariable=self.font_var,
+            values=list(app.available_fonts.keys()),
+            state="readonly",
+        )
+        self.font_selector.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
+        self.font_selector.bind("<<ComboboxSelected>>", lambda _: self.on_font_selected())
+
+        ttk.Label(controls_frame, text="Font size", style="Card.TLabel").grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        self.size_scale = tk.Scale(
+            controls_frame,
+            from_=5,
+            to=max(int(rect_info["rect_height"]), 10),
+            orient="horizontal",
+            variable=self.size_var,
+            command=lambda _: self.schedule_preview(),
+            bg=palette["card"],
+            troughcolor=palette["outline"],
+            highlightthickness=0,
+            sliderrelief="flat",
+        )
+        self.size_scale.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(controls_frame, text="Horizontal offset", style="Card.TLabel").grid(row=3, column=0, sticky="w", padx=5, pady=5)
+        x_scale = tk.Scale(
+            controls_frame,
+            from_=-x_offset_limit,
+            to=x_offset_limit,
+            orient="horizontal",
+            resolution=1,
+            variable=self.x_offset_var,
+            command=lambda _: self.schedule_preview(),
+            bg=palette["card"],
+            troughcolor=palette["outline"],
+            highlightthickness=0,
+            sliderrelief="flat",
+        )
+        x_scale.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(controls_frame, text="Vertical offset", style="Card.TLabel").grid(row=4, column=0, sticky="w", padx=5, pady=5)
+        y_scale = tk.Scale(
+            controls_frame,
+            from_=-y_offset_limit,
+            to=y_offset_limit,
+            orient="horizontal",
+            resolution=1,
+            variable=self.y_offset_var,
+            command=lambda _: self.schedule_preview(),
+            bg=palette["card"],
+            troughcolor=palette["outline"],
+            highlightthickness=0,
+            sliderrelief="flat",
+        )
+        y_scale.grid(row=4, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Button(button_frame, text="Save & Next", style="Accent.TButton", command=self.on_next).pack(
+            side="left", padx=5
+        )
+        ttk.Button(button_frame, text="Cancel", command=self.on_cancel).pack(side="left", padx=5)
+
+        window.bind("<Return>", lambda _: self.on_next())
+        window.bind("<Escape>", lambda _: self.on_cancel())
+        window.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        # Closing the main window tears the dialog down without either button; that must still end ask().
+        window.bind("<Destroy>", self.on_destroy)
+
+    def ask(self, name_text: str, default_font: str, default_size: int) -> Optional[dict]:
+        """Show name_text in the dialog and wait for the user to accept or cancel it."""
+
+        self.name_text = name_text
+        self.result = {}
+        self.window.title(f"Review Certificate — {name_text}")
+        self.size_scale.configure(to=max(int(self.app.rect_info["rect_height"]), default_size + 40, 10))
+        self.font_var.set(default_font)
+        self.confirmed_font = default_font
+        self.size_var.set(max(5, default_size))
+        self.x_offset_var.set(0)
+        self.y_offset_var.set(0)
+        self.update_preview()
+
+        self.decision.set("")
+        self.window.grab_set()
+        self.window.wait_variable(self.decision)
+        return self.result if self.decision.get() == "next" else None
+
+    def close(self) -> None:
+        if self.window.winfo_exists():
+            self.window.destroy()
+
+    def compute_positions(self) -> Tuple[str, int, float, float]:
+        rect_info = self.app.rect_info
+        current_font = self.font_var.get()
+        current_size = max(5, int(self.size_var.get()))
+        text_width = cached_string_width(self.name_text, self.app.ensure_font_registered(current_font), current_size)
+        base_x = rect_info["x_left"] + (rect_info["rect_width"] - text_width) / 2
+        base_y = rect_info["y_bottom"] + (rect_info["rect_height"] - current_size) / 2
+        adjusted_x = base_x + float(self.x_offset_var.get())
+        adjusted_y = base_y + float(self.y_offset_var.get())
+        return current_font, current_size, adjusted_x, adjusted_y
+
+    def schedule_preview(self) -> None:
+        # Scale widgets fire on every pixel of a drag; coalesce those into one redraw per idle cycle.
+        if not self.preview_pending:
+            self.preview_pending = True
+            self.window.after_idle(self.flush_preview)
+
+    def flush_preview(self) -> None:
+        self.preview_pending = False
+        if self.window.winfo_exists():
+            self.update_preview()
+
+    def update_preview(self) -> None:
+        # Releasing a slider on the value it already had still fires its command; skip identical redraws.
+        rendered = (
+            self.name_text,
+            self.font_var.get(),
+            int(self.size_var.get()),
+            int(self.x_offset_var.get()),
+            int(self.y_offset_var.get()),
+        )
+        if rendered == self.last_rendered:
+            return
+        try:
+            current_font, current_size, adjusted_x, adjusted_y = self.compute_positions()
+            preview_scale = self.preview_scale
+            text_layer, (offset_x, offset_y) = render_text_layer(
+                self.app.available_fonts[current_font], max(1, round(current_size * preview_scale)), self.name_text
+            )
+
+            # Offset-only changes reuse the shown layer; a same-sized layer is pasted into the existing Tk image.
+            if text_layer is not self.text_layer:
+                if self.text_photo is not None and (self.text_photo.width(), self.text_photo.height()) == text_layer.size:
+                    self.text_photo.paste(text_layer)
+                else:
+                    self.text_photo = ImageTk.PhotoImage(text_layer)
+                    self.preview_canvas.itemconfigure(self.text_item, image=self.text_photo)
+                self.text_layer = text_layer
+            self.preview_canvas.coords(
+                self.text_item,
+                int(adjusted_x * preview_scale) + offset_x,
+                int((self.app.page_size[1] - adjusted_y) * preview_scale) + offset_y,
+            )
+            self.last_rendered = rendered
+        except OSError as error:
+            messagebox.showerror("Font Error", f"Unable to load font file.\n{error}", parent=self.window)
+
+    def on_font_selected(self) -> None:
+        # Fonts are only parsed once picked; fall back to the previous font if this one is unreadable.
+        if self.app.register_font(self.font_var.get(), parent=self.window):
+            self.confirmed_font = self.font_var.get()
+        else:
+            self.font_selector.configure(values=list(self.app.available_fonts.keys()))
+            self.font_var.set(self.confirmed_font)
+        self.schedule_preview()
+
+    def on_next(self) -> None:
+        current_font, current_size, adjusted_x, adjusted_y = self.compute_positions()
+        self.result = {"font": current_font, "size": current_size, "x": adjusted_x, "y": adjusted_y}
+        self.decision.set("next")
+
+    def on_cancel(self) -> None:
+        self.result = {}
+        self.decision.set("cancel")
+
+    def on_destroy(self, event: tk.Event) -> None:
+        # <Destroy> also fires for each child widget; only the dialog itself going away counts as a cancel.
+        if event.widget is self.window and not self.decision.get():
+            self.on_cancel()
+
+
 class CertificateApp:
     """Interactive, modern certificate generator."""
 
@@ -110,14 +397,25 @@ class CertificateApp:
         self.pdf_path: Optional[str] = None
         self.names_path: Optional[str] = None
         self.names: list[str] = []
-        self.template_pdf_bytes: Optional[bytes] = None
 
-        self.pix: Optional[fitz.Pixmap] = None
+        # Template page size in PDF points, and pixels per point of self.img
+        self.page_size: Tuple[float, float] = (0.0, 0.0)
+        self.raster_scale: float = 1.0
         self.img: Optional[Image.Image] = None
+        self.selection_ppm: Optional[bytes] = None
+        self.selection_scale: float = 1.0
+        self.review_background: Optional[Tuple[Image.Image, float]] = None
         self.rect_info: Optional[dict] = None
         self.last_font_size: Optional[int] = None
 
         self.output_dir: str = self.default_output_dir()
+        self.combine_output = tk.BooleanVar(value=False)
+
+        # Certificates are written by worker processes after the review; the UI polls their futures.
+        self.pending_exports: List[Tuple[str, Future]] = []
+        self.completion_message: Optional[str] = None
+        # (label, error) for exports that failed since the last summary dialog
+        self.failed_exports: List[Tuple[str, BaseException]] = []
 
         # UI state string variables
         self.pdf_status = tk.StringVar(value="No template selected")
@@ -134,6 +432,7 @@ class CertificateApp:
         self.build_layout()
         self.refresh_metrics()
         self.root.mainloop()
+        wait([future for _, future in self.pending_exports])
 
     def update_theme_button_label(self) -> None:
         target = "Light" if self.theme_name.get() == "dark" else "Dark"
@@ -167,27 +466,17 @@ class CertificateApp:
         self.update_ready_state()
 
     def load_fonts(self) -> Dict[str, str]:
-        """Auto-register TTF/OTF fonts from the bundled fonts directory."""
+        """Discover TTF/OTF fonts from the bundled fonts directory without parsing them.
+
+        Each font is parsed and registered with ReportLab only once it is picked; see register_font.
+        """
 
         fonts_dir = os.path.join(os.path.dirname(__file__), "fonts")
-        available_fonts: Dict[str, str] = {}
 
         if not os.path.exists(fonts_dir):
             os.makedirs(fonts_dir)
 
-        for root_dir, _, files in os.walk(fonts_dir):
-            family = os.path.basename(root_dir)
-            for font_file in files:
-                if font_file.lower().endswith((".ttf", ".otf")):
-                    font_path = os.path.join(root_dir, font_file)
-                    font_label = (
-                        f"{family}/{os.path.splitext(font_file)[0]}" if family != "fonts" else os.path.splitext(font_file)[0]
-                    )
-                    try:
-                        pdfmetrics.registerFont(TTFont(font_label, font_path))
-                        available_fonts[font_label] = font_path
-                    except Exception as exc:  # font registration failed
-                        print(f"Warning: Could not register font '{font_label}' at {font_path}: {exc}")
+        available_fonts = dict(scan_font_files(fonts_dir))
 
         if not available_fonts:
             messagebox.showerror(
@@ -198,6 +487,30 @@ class CertificateApp:
 
         return available_fonts
 
+    def ensure_font_registered(self, font_label: str) -> str:
+        """Register a font with ReportLab the first time it is needed and return its label."""
+
+        ensure_font_registered(font_label, self.available_fonts[font_label])
+        return font_label
+
+    def register_font(self, font_label: str, parent: Optional[tk.Misc] = None) -> bool:
+        """Parse a font on first use; an unreadable font is dropped from the list."""
+
+        try:
+            self.ensure_font_registered(font_label)
+            return True
+        except Exception as exc:
+            font_path = self.available_fonts.pop(font_label)
+            log.warning("Could not register font %r at %s: %s", font_label, font_path, exc)
+            self.font_selector.configure(values=list(self.available_fonts.keys()))
+            if self.selected_font.get() == font_label:
+                self.selected_font.set(next(iter(self.available_fonts), ""))
+            messagebox.showerror(
+                "Font Error", f"Could not load the font '{font_label}'. Choose another one.\n{exc}", parent=parent or self.root
+            )
+            self.update_ready_state()
+            return False
+
     def build_layout(self) -> None:
         """Compose a two-column layout with hero header, metrics, and workflow controls."""
 
@@ -338,6 +651,7 @@ class CertificateApp:
             state="readonly",
         )
         self.font_selector.grid(row=1, column=1, sticky="ew", padx=(10, 0))
+        self.font_selector.bind("<<ComboboxSelected>>", lambda _: self.register_font(self.selected_font.get()))
         ttk.Label(
             font_section,
             text="Drop new .ttf/.otf files into the fonts/ folder to expand this list instantly.",
@@ -359,6 +673,12 @@ class CertificateApp:
         ttk.Label(output_section, text="4. Output", style="Emphasis.TLabel").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 6))
         ttk.Button(output_section, text="Choose output folder", command=self.choose_output_dir).grid(row=1, column=0, padx=(0, 12), pady=4)
         ttk.Label(output_section, textvariable=self.output_status, style="Card.TLabel", wraplength=420).grid(row=1, column=1, sticky="w")
+        ttk.Checkbutton(
+            output_section,
+            text=f"Combine all certificates into one PDF ({COMBINED_FILENAME})",
+            variable=self.combine_output,
+            style="Card.TCheckbutton",
+        ).grid(row=2, column=0, columnspan=2, sticky="w", pady=(6, 0))
 
         # Step 5 — Review
         review_section = ttk.Frame(container, style="Card.TFrame")
@@ -383,7 +703,7 @@ class CertificateApp:
         self.pdf_path = path
         self.area_status.set("Area not selected")
         self.rect_info = None
-        self.pdf_status.set(f"Template: {os.path.basename(path)} ({self.pix.width} x {self.pix.height}px)")
+        self.pdf_status.set(f"Template: {os.path.basename(path)} ({int(self.page_size[0])} x {int(self.page_size[1])}px)")
         self.refresh_metrics()
         self.update_ready_state()
 
@@ -392,8 +712,9 @@ class CertificateApp:
         if not path:
             return
 
-        with open(path, "r", encoding="utf-8") as handle:
-            names = [line.strip() for line in handle.readlines() if line.strip()]
+        # utf-8-sig drops a leading BOM so it never ends up in the first certificate
+        with open(path, "r", encoding="utf-8-sig") as handle:
+            names = [stripped for stripped in (line.strip() for line in handle) if stripped]
 
         if not names:
             messagebox.showwarning("Names", "The selected file has no names.")
@@ -415,32 +736,66 @@ class CertificateApp:
         self.update_ready_state()
 
     def load_pdf_preview(self, path: str) -> bool:
+        doc = None
         try:
             doc = fitz.open(path)
             page = doc.load_page(0)
-            self.pix = page.get_pixmap()
-            self.img = Image.frombytes("RGB", [self.pix.width, self.pix.height], self.pix.samples)
-            return True
+            # Never rasterize beyond what the selection dialog can show on screen.
+            max_width = min(MAX_RASTER_WIDTH, self.root.winfo_screenwidth() - 100)
+            max_height = min(MAX_RASTER_HEIGHT, self.root.winfo_screenheight() - 260)
+            raster_scale = min(1.0, max_width / page.rect.width, max_height / page.rect.height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(raster_scale, raster_scale), alpha=False)
+            # Pillow only maps 4-byte modes in place, so this copies the RGB samples out of pix.
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+            selection_ppm, selection_scale = self.render_selection_ppm(page, pix, raster_scale)
+            page_size = (page.rect.width, page.rect.height)
         except Exception as exc:
             messagebox.showerror("PDF Error", f"Unable to open the template.\n{exc}")
             return False
         finally:
-            try:
+            # Nothing keeps the document or the pixmap alive; later previews re-open the file on demand.
+            if doc is not None:
                 doc.close()
-            except Exception:
-                pass
+
+        self.img = img
+        # Shared by every area-selection dialog for this template
+        self.selection_ppm, self.selection_scale = selection_ppm, selection_scale
+        self.page_size = page_size
+        self.raster_scale = raster_scale
+        return True
+
+    def render_at_scale(self, scale: float) -> Image.Image:
+        """Rasterize the template page with MuPDF directly at the requested scale."""
+
+        with fitz.open(self.pdf_path) as doc:
+            pix = doc.load_page(0).get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+    @staticmethod
+    def render_selection_ppm(page: fitz.Page, pix: fitz.Pixmap, raster_scale: float) -> Tuple[bytes, float]:
+        """Encode the template as PPM for the area-selection canvas, downscaled to fit SELECTION_MAX_*.
+
+        Tk decodes PPM itself, so this one-shot display needs no PIL image. Returns the data and the
+        scale relative to pix, which was rendered from page at raster_scale.
+        """
+
+        scale = min(1.0, SELECTION_MAX_WIDTH / max(1, pix.width), SELECTION_MAX_HEIGHT / max(1, pix.height))
+        if abs(scale - 1.0) < 1e-6:
+            return pix.tobytes("ppm"), 1.0
+        zoom = raster_scale * scale
+        return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False).tobytes("ppm"), scale
 
     def select_area(self) -> None:
-        if not self.pix or not self.img:
+        if not self.selection_ppm or not self.img:
             messagebox.showinfo("Template required", "Choose a template PDF first.")
             return
 
-        print("[DEBUG] select_area invoked")
-        rect_start, rect_end = self.show_rectangle_selection(self.img, self.pix)
-        print("[DEBUG] select_area returned start=%s end=%s" % (rect_start, rect_end))
+        log.debug("select_area invoked")
+        rect_start, rect_end = self.show_rectangle_selection(self.selection_ppm, self.selection_scale)
+        log.debug("select_area returned start=%s end=%s", rect_start, rect_end)
         if not rect_start or not rect_end:
             self.area_status.set("Area not selected — draw a rectangle and confirm")
-            print("[DEBUG] Rectangle selection missing: rect_start=%s rect_end=%s" % (rect_start, rect_end))
+            log.debug("Rectangle selection missing: rect_start=%s rect_end=%s", rect_start, rect_end)
             self.refresh_metrics()
             self.update_ready_state()
             return
@@ -448,7 +803,7 @@ class CertificateApp:
         # Avoid zero-size selections
         if rect_start == rect_end:
             self.area_status.set("Area not selected — rectangle has zero size")
-            print("[DEBUG] Rectangle selection zero-size: rect_start=%s rect_end=%s" % (rect_start, rect_end))
+            log.debug("Rectangle selection zero-size: rect_start=%s rect_end=%s", rect_start, rect_end)
             self.refresh_metrics()
             self.update_ready_state()
             return
@@ -456,11 +811,11 @@ class CertificateApp:
         # Normalize to ints in case of float coords from canvas
         norm_start = (int(rect_start[0]), int(rect_start[1]))
         norm_end = (int(rect_end[0]), int(rect_end[1]))
-        self.rect_info = self.calculate_rect(norm_start, norm_end, self.pix.height)
+        self.rect_info = self.calculate_rect(norm_start, norm_end)
         rect_width = int(self.rect_info["rect_width"])
         rect_height = int(self.rect_info["rect_height"])
         self.area_status.set(f"Selected area: {rect_width} x {rect_height} px")
-        print("[DEBUG] Rectangle selection accepted: start=%s end=%s size=%sx%s" % (norm_start, norm_end, rect_width, rect_height))
+        log.debug("Rectangle selection accepted: start=%s end=%s size=%sx%s", norm_start, norm_end, rect_width, rect_height)
         self.refresh_metrics()
         self.update_ready_state()
 
@@ -468,45 +823,124 @@ class CertificateApp:
         if not self.pdf_path or not self.names or not self.rect_info or not self.output_dir:
             messagebox.showinfo("Missing info", "Please finish selecting files, font, area, and output folder first.")
             return
+        if not self.register_font(self.selected_font.get()):
+            return
 
         os.makedirs(self.output_dir, exist_ok=True)
 
-        with open(self.pdf_path, "rb") as template_file:
-            self.template_pdf_bytes = template_file.read()
-
         last_font = self.selected_font.get()
         self.last_font_size = None
+        # The template and placement outline are fixed for the whole session; render them once for every dialog.
+        self.review_background = self.build_review_background()
+
+        reviewed: List[Tuple[str, dict]] = []
+        dialog = ReviewWindow(self)
+        try:
+            for name in self.names:
+                # After the first name the previous choice carries over, so only the first one needs measuring.
+                if self.last_font_size is None:
+                    initial_size = self.calculate_initial_font_size(name, last_font)
+                else:
+                    initial_size = max(5, min(int(self.rect_info["rect_height"]), self.last_font_size))
+
+                review_result = dialog.ask(name, last_font, initial_size)
+                if not review_result:
+                    message = "Certificate generation cancelled by user."
+                    break
+
+                last_font = review_result["font"]
+                self.last_font_size = review_result["size"]
+
+                reviewed.append((name, review_result))
+                self.progress_status.set(f"Reviewed {len(reviewed)}/{len(self.names)}: {name}")
+            else:
+                message = "All certificates generated with manual review!"
+        finally:
+            dialog.close()
+
+        if reviewed:
+            self.export_certificates(reviewed)
+        self.finish_review(message)
+
+    def export_certificates(self, reviewed: List[Tuple[str, dict]]) -> None:
+        """Write every reviewed name in parallel worker processes."""
 
-        for name in self.names:
-            initial_size = self.calculate_initial_font_size(name, last_font)
-            if self.last_font_size:
-                initial_size = max(5, min(int(self.rect_info["rect_height"]), self.last_font_size))
-
-            review_result = self.review_name(name, last_font, initial_size)
-            if not review_result:
-                self.progress_status.set("Certificate generation cancelled by user.")
-                break
-
-            last_font = review_result["font"]
-            self.last_font_size = review_result["size"]
-
-            self.generate_certificate(
-                name,
-                review_result["font"],
-                review_result["size"],
-                review_result["x"],
-                review_result["y"],
+        entries: List[CertificateEntry] = [
+            (name_text, result["font"], self.available_fonts[result["font"]], result["size"], result["x"], result["y"])
+            for name_text, result in reviewed
+        ]
+        if self.combine_output.get():
+            jobs = [(COMBINED_FILENAME, os.path.join(self.output_dir, COMBINED_FILENAME), entries)]
+        else:
+            jobs = []
+            used_names: Set[str] = set()
+            for entry in entries:
+                # Names that sanitize to the same file would overwrite each other from different workers.
+                stem = f"certificate_{sanitize_filename(entry[0])}"
+                file_name, suffix = f"{stem}.pdf", 2
+                while file_name.lower() in used_names:
+                    file_name, suffix = f"{stem}_{suffix}.pdf", suffix + 1
+                used_names.add(file_name.lower())
+                jobs.append((f"certificate for {entry[0]}", os.path.join(self.output_dir, file_name), [entry]))
+
+        # Workers open the template from its path in their initializer, so nothing large is pickled per process.
+        export_pool = ProcessPoolExecutor(
+            max_workers=min(len(jobs), os.cpu_count() or 1),
+            initializer=init_worker,
+            initargs=(self.pdf_path,),
+        )
+        for label, output_filename, job_entries in jobs:
+            self.pending_exports.append(
+                (label, export_pool.submit(write_certificates, output_filename, job_entries, self.page_size))
             )
-            self.progress_status.set(f"Saved certificate for {name}")
+        # Queued jobs still run to completion; the pool just releases its workers once they are done.
+        export_pool.shutdown(wait=False)
+        self.root.after(50, self.drain_exports)
+
+    def finish_review(self, message: str) -> None:
+        if self.pending_exports:
+            self.completion_message = message
         else:
-            self.progress_status.set("All certificates generated with manual review!")
+            self.progress_status.set(message)
+
+    def drain_exports(self) -> None:
+        """Poll background exports from the Tk thread and report their progress."""
+
+        remaining: List[Tuple[str, Future]] = []
+        for label, future in self.pending_exports:
+            if not future.done():
+                remaining.append((label, future))
+            elif future.exception() is not None:
+                log.error("Could not save %s: %s", label, future.exception())
+                self.failed_exports.append((label, future.exception()))
+            else:
+                self.progress_status.set(f"Saved {label}")
+        self.pending_exports = remaining
+
+        if remaining:
+            self.root.after(50, self.drain_exports)
+            return
 
-    def calculate_rect(self, rect_start: Tuple[int, int], rect_end: Tuple[int, int], pix_height: int) -> dict:
-        print("[DEBUG] calculate_rect inputs start=%s end=%s pix_height=%s" % (rect_start, rect_end, pix_height))
+        if self.completion_message:
+            self.progress_status.set(self.completion_message)
+            self.completion_message = None
+        if self.failed_exports:
+            failed, self.failed_exports = self.failed_exports, []
+            details = "\n".join(f"{label}: {exc}" for label, exc in failed[:MAX_LISTED_FAILURES])
+            if len(failed) > MAX_LISTED_FAILURES:
+                details += f"\n… and {len(failed) - MAX_LISTED_FAILURES} more"
+            self.progress_status.set(f"{len(failed)} export(s) failed")
+            messagebox.showerror("Export Error", f"Could not save {len(failed)} file(s).\n{details}")
+
+    def calculate_rect(self, rect_start: Tuple[int, int], rect_end: Tuple[int, int]) -> dict:
+        """Map a rectangle drawn on the rasterized template back to PDF coordinates."""
+
+        log.debug("calculate_rect inputs start=%s end=%s raster_scale=%s", rect_start, rect_end, self.raster_scale)
         x1, y1 = rect_start
         x2, y2 = rect_end
-        pdf_x1, pdf_y1 = x1, pix_height - y1
-        pdf_x2, pdf_y2 = x2, pix_height - y2
+        page_height = self.page_size[1]
+        pdf_x1, pdf_y1 = x1 / self.raster_scale, page_height - y1 / self.raster_scale
+        pdf_x2, pdf_y2 = x2 / self.raster_scale, page_height - y2 / self.raster_scale
 
         rect_width = abs(pdf_x2 - pdf_x1)
         rect_height = abs(pdf_y2 - pdf_y1)
@@ -527,220 +961,51 @@ class CertificateApp:
     def calculate_initial_font_size(self, text_value: str, selected_font: str) -> int:
         """Find the largest font size that fits the selected rectangle."""
 
+        # Text width is linear in the font size, so one measurement gives the best fit directly.
         max_size = int(min(self.rect_info["rect_height"], 120)) or 5
-        size = max_size
-        while size >= 5:
-            text_width = stringWidth(text_value, selected_font, size)
-            if text_width <= self.rect_info["rect_width"] and size <= self.rect_info["rect_height"]:
-                return size
-            size -= 1
-        return 5
-
-    def review_name(self, name_text: str, default_font: str, default_size: int) -> Optional[dict]:
-        """Manual review dialog with live preview."""
-
-        result: dict = {}
-        window = tk.Toplevel(self.root)
-        window.title(f"Review Certificate — {name_text}")
-        window.configure(bg=self.palette["card"], padx=12, pady=12)
-        window.columnconfigure(0, weight=1)
-        window.columnconfigure(1, weight=0)
-        window.rowconfigure(0, weight=1)
-
-        preview_scale = min(1.0, 820 / max(1, self.pix.width), 560 / max(1, self.pix.height))
-        display_width = int(self.pix.width * preview_scale)
-        display_height = int(self.pix.height * preview_scale)
-
-        use_original_size = abs(preview_scale - 1.0) < 1e-6
-        preview_image = self.img if use_original_size else self.img.resize((display_width, display_height), Image.LANCZOS)
-        preview_photo = ImageTk.PhotoImage(preview_image)
-
-        preview_label = tk.Label(window, image=preview_photo, bd=2, relief="sunken")
-        preview_label.grid(row=0, column=0, rowspan=6, sticky="nsew", padx=(0, 12))
-        preview_label.image = preview_photo
-
-        controls_frame = ttk.Frame(window, style="Card.TFrame")
-        controls_frame.grid(row=0, column=1, sticky="n")
-        controls_frame.columnconfigure(1, weight=1)
-
-        button_frame = ttk.Frame(controls_frame, style="Card.TFrame")
-        button_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 8))
-
-        font_var = tk.StringVar(value=default_font)
-        size_var = tk.IntVar(value=max(5, default_size))
-        x_offset_limit = int(max(10, self.rect_info["rect_width"] / 2))
-        y_offset_limit = int(max(10, self.rect_info["rect_height"] / 2))
-        x_offset_var = tk.DoubleVar(value=0)
-        y_offset_var = tk.DoubleVar(value=0)
-
-        ttk.Label(controls_frame, text="Font", style="Card.TLabel").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        font_selector = ttk.Combobox(
-            controls_frame,
-            textvariable=font_var,
-            values=list(self.available_fonts.keys()),
-            state="readonly",
-        )
-        font_selector.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
-        font_selector.bind("<<ComboboxSelected>>", lambda _: update_preview())
-
-        ttk.Label(controls_frame, text="Font size", style="Card.TLabel").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        size_scale_max = max(int(self.rect_info["rect_height"]), default_size + 40, 10)
-        size_scale = tk.Scale(
-            controls_frame,
-            from_=5,
-            to=size_scale_max,
-            orient="horizontal",
-            variable=size_var,
-            command=lambda _: update_preview(),
-            bg=self.palette["card"],
-            troughcolor=self.palette["outline"],
-            highlightthickness=0,
-            sliderrelief="flat",
+        width_at_1 = cached_string_width(text_value, self.ensure_font_registered(selected_font), 1000) / 1000.0
+        size = min(max_size, int(self.rect_info["rect_width"] / width_at_1)) if width_at_1 > 0 else max_size
+        return max(5, size)
+
+    def build_review_background(self) -> Tuple[Image.Image, float]:
+        """Render the template at review-preview scale with the placement outline drawn in."""
+
+        page_width, page_height = self.page_size
+        preview_scale = min(1.0, 820 / max(1, page_width), 560 / max(1, page_height))
+        use_raster_size = abs(preview_scale - self.raster_scale) < 1e-6
+        preview_bg = self.img.copy() if use_raster_size else self.render_at_scale(preview_scale)
+        raster_to_preview = preview_scale / self.raster_scale
+        ImageDraw.Draw(preview_bg).rectangle(
+            [
+                int(self.rect_info["tk_left"] * raster_to_preview),
+                int(self.rect_info["tk_top"] * raster_to_preview),
+                int(self.rect_info["tk_right"] * raster_to_preview),
+                int(self.rect_info["tk_bottom"] * raster_to_preview),
+            ],
+            outline=self.palette["accent"],
+            width=2,
         )
-        size_scale.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
+        return preview_bg, preview_scale
 
-        ttk.Label(controls_frame, text="Horizontal offset", style="Card.TLabel").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        x_scale = tk.Scale(
-            controls_frame,
-            from_=-x_offset_limit,
-            to=x_offset_limit,
-            orient="horizontal",
-            resolution=1,
-            variable=x_offset_var,
-            command=lambda _: update_preview(),
-            bg=self.palette["card"],
-            troughcolor=self.palette["outline"],
-            highlightthickness=0,
-            sliderrelief="flat",
-        )
-        x_scale.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
+    def show_rectangle_selection(self, ppm_data: bytes, scale: float) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """Let the user draw a rectangle; return last drawn rectangle even if window is closed.
 
-        ttk.Label(controls_frame, text="Vertical offset", style="Card.TLabel").grid(row=4, column=0, sticky="w", padx=5, pady=5)
-        y_scale = tk.Scale(
-            controls_frame,
-            from_=-y_offset_limit,
-            to=y_offset_limit,
-            orient="horizontal",
-            resolution=1,
-            variable=y_offset_var,
-            command=lambda _: update_preview(),
-            bg=self.palette["card"],
-            troughcolor=self.palette["outline"],
-            highlightthickness=0,
-            sliderrelief="flat",
-        )
-        y_scale.grid(row=4, column=1, sticky="ew", padx=5, pady=5)
-
-        def compute_positions() -> Tuple[str, int, float, float]:
-            current_font = font_var.get()
-            current_size = max(5, int(size_var.get()))
-            text_width = stringWidth(name_text, current_font, current_size)
-            base_x = self.rect_info["x_left"] + (self.rect_info["rect_width"] - text_width) / 2
-            base_y = self.rect_info["y_bottom"] + (self.rect_info["rect_height"] - current_size) / 2
-            adjusted_x = base_x + float(x_offset_var.get())
-            adjusted_y = base_y + float(y_offset_var.get())
-            return current_font, current_size, adjusted_x, adjusted_y
-
-        def update_preview() -> None:
-            try:
-                current_font, current_size, adjusted_x, adjusted_y = compute_positions()
-                working_image = self.img.copy()
-                draw = ImageDraw.Draw(working_image)
-                draw.rectangle(
-                    [
-                        int(self.rect_info["tk_left"]),
-                        int(self.rect_info["tk_top"]),
-                        int(self.rect_info["tk_right"]),
-                        int(self.rect_info["tk_bottom"]),
-                    ],
-                    outline=self.palette["accent"],
-                    width=2,
-                )
-
-                font_path = self.available_fonts[current_font]
-                pil_font = ImageFont.truetype(font_path, current_size)
-                draw.text(
-                    (int(adjusted_x), int(self.pix.height - adjusted_y)),
-                    name_text,
-                    font=pil_font,
-                    fill=(255, 255, 255),
-                    anchor="ls",
-                )
-
-                display_image = working_image
-                if not use_original_size:
-                    width = int(self.pix.width * preview_scale)
-                    height = int(self.pix.height * preview_scale)
-                    display_image = working_image.resize((width, height), Image.LANCZOS)
-
-                preview = ImageTk.PhotoImage(display_image)
-                preview_label.configure(image=preview)
-                preview_label.image = preview
-            except OSError as error:
-                messagebox.showerror("Font Error", f"Unable to load font file.\n{error}", parent=window)
-
-        def on_next() -> None:
-            current_font, current_size, adjusted_x, adjusted_y = compute_positions()
-            result["font"] = current_font
-            result["size"] = current_size
-            result["x"] = adjusted_x
-            result["y"] = adjusted_y
-            window.destroy()
-
-        def on_cancel() -> None:
-            result.clear()
-            window.destroy()
-
-        ttk.Button(button_frame, text="Save & Next", style="Accent.TButton", command=on_next).pack(
-            side="left", padx=5
-        )
-        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side="left", padx=5)
-
-        controls_frame.columnconfigure(1, weight=1)
-
-        window.bind("<Return>", lambda _: on_next())
-        window.bind("<Escape>", lambda _: on_cancel())
-        window.protocol("WM_DELETE_WINDOW", on_cancel)
-        window.update_idletasks()
-        update_preview()
-        window.grab_set()
-        self.root.wait_window(window)
-
-        return result if result else None
-
-    def generate_certificate(self, name_text: str, font_choice: str, font_size: int, pdf_x: float, pdf_y: float) -> None:
-        packet = io.BytesIO()
-        c = canvas.Canvas(packet, pagesize=(self.pix.width, self.pix.height))
-        c.setFont(font_choice, font_size)
-        c.setFillColorRGB(1, 1, 1)
-        c.drawString(pdf_x, pdf_y, name_text)
-        c.save()
-
-        packet.seek(0)
-        template_reader = PdfReader(io.BytesIO(self.template_pdf_bytes))
-        overlay_reader = PdfReader(packet)
-        writer = PdfWriter()
-
-        base_page = template_reader.pages[0]
-        base_page.merge_page(overlay_reader.pages[0])
-        writer.add_page(base_page)
-
-        output_filename = os.path.join(self.output_dir, f"certificate_{sanitize_filename(name_text)}.pdf")
-        with open(output_filename, "wb") as out_file:
-            writer.write(out_file)
-
-    def show_rectangle_selection(self, img: Image.Image, pix: fitz.Pixmap) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
-        """Let the user draw a rectangle; return last drawn rectangle even if window is closed."""
+        The dialog shows ``ppm_data``, the template raster downscaled by ``scale``; the returned
+        corners are mapped back to template raster coordinates.
+        """
 
         selection = {"start": None, "end": None, "coords": None}
         rect_id = None
+        # Latest pointer position while dragging; the rectangle follows it once per idle pass
+        drag = {"pointer": None, "pending": False}
 
         win = tk.Toplevel(self.root)
         win.title("Mark name placement area")
         win.configure(bg=self.palette["card"])
+        tk_img = tk.PhotoImage(master=win, data=ppm_data, format="ppm")
 
-        window_width = min(pix.width + 60, win.winfo_screenwidth() - 40)
-        window_height = min(pix.height + 180, win.winfo_screenheight() - 80)
+        window_width = min(tk_img.width() + 60, win.winfo_screenwidth() - 40)
+        window_height = min(tk_img.height() + 180, win.winfo_screenheight() - 80)
         win.geometry(f"{window_width}x{window_height}")
         win.resizable(False, False)
 
@@ -754,14 +1019,13 @@ class CertificateApp:
 
         canvas_widget = tk.Canvas(
             win,
-            width=pix.width,
-            height=pix.height,
+            width=tk_img.width(),
+            height=tk_img.height(),
             bg="#0b1220",
             highlightthickness=2,
             highlightbackground=self.palette["outline"],
         )
         canvas_widget.pack(pady=10)
-        tk_img = ImageTk.PhotoImage(img)
         canvas_widget.create_image(0, 0, anchor="nw", image=tk_img)
 
         confirm_btn = ttk.Button(win, text="Confirm selection", style="Accent.TButton")
@@ -771,32 +1035,42 @@ class CertificateApp:
         def on_mouse_down(event):
             nonlocal rect_id
             selection["start"] = (event.x, event.y)
+            drag["pointer"] = None
             rect_id = canvas_widget.create_rectangle(event.x, event.y, event.x, event.y, outline=self.palette["accent"], width=2)
-            print("[DEBUG] Rectangle mouse_down start=%s" % (selection["start"],))
+            log.debug("Rectangle mouse_down start=%s", selection["start"])
 
         def on_mouse_move(event):
-            nonlocal rect_id
-            if rect_id:
-                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], event.x, event.y)
+            drag["pointer"] = (event.x, event.y)
+            if rect_id and not drag["pending"]:
+                drag["pending"] = True
+                canvas_widget.after_idle(flush_drag)
+
+        def flush_drag():
+            drag["pending"] = False
+            if rect_id and drag["pointer"] and canvas_widget.winfo_exists():
+                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], *drag["pointer"])
 
         def on_mouse_up(event):
             selection["end"] = (event.x, event.y)
+            # A flush still queued from the drag must not move the rectangle back to an older motion point.
+            drag["pointer"] = None
             if rect_id:
+                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], event.x, event.y)
                 selection["coords"] = canvas_widget.coords(rect_id)
             helper.configure(text=f"Selected from {selection['start']} to {selection['end']}. Click Confirm selection.")
             confirm_btn.state(["!disabled"])
-            print("[DEBUG] Rectangle mouse_up end=%s coords=%s" % (selection["end"], selection["coords"]))
+            log.debug("Rectangle mouse_up end=%s coords=%s", selection["end"], selection["coords"])
 
         def on_confirm():
             if rect_id and not selection["coords"]:
                 selection["coords"] = canvas_widget.coords(rect_id)
-            print("[DEBUG] Rectangle confirm coords=%s start=%s end=%s" % (selection["coords"], selection["start"], selection["end"]))
+            log.debug("Rectangle confirm coords=%s start=%s end=%s", selection["coords"], selection["start"], selection["end"])
             win.destroy()
 
         def on_close():
             if rect_id and not selection["coords"]:
                 selection["coords"] = canvas_widget.coords(rect_id)
-            print("[DEBUG] Rectangle close coords=%s start=%s end=%s" % (selection["coords"], selection["start"], selection["end"]))
+            log.debug("Rectangle close coords=%s start=%s end=%s", selection["coords"], selection["start"], selection["end"])
             win.destroy()
 
         canvas_widget.bind("<Button-1>", on_mouse_down)
@@ -813,26 +1087,31 @@ class CertificateApp:
         win.grab_set()
         self.root.wait_window(win)
 
+        def to_raster(x: float, y: float) -> Tuple[int, int]:
+            return int(x / scale), int(y / scale)
+
         # Prefer exact start/end, but fall back to canvas coords if needed
         if selection["start"] and selection["end"]:
-            print("[DEBUG] Rectangle return start/end=%s %s" % (selection["start"], selection["end"]))
-            return selection["start"], selection["end"]
+            log.debug("Rectangle return start/end=%s %s", selection["start"], selection["end"])
+            return to_raster(*selection["start"]), to_raster(*selection["end"])
         if selection["coords"]:
             x1, y1, x2, y2 = selection["coords"]
-            print("[DEBUG] Rectangle return coords=%s" % (selection["coords"],))
-            return (int(x1), int(y1)), (int(x2), int(y2))
-        print("[DEBUG] Rectangle return None (no selection)")
+            log.debug("Rectangle return coords=%s", selection["coords"])
+            return to_raster(x1, y1), to_raster(x2, y2)
+        log.debug("Rectangle return None (no selection)")
         return None, None
 
     def update_ready_state(self) -> None:
         self.refresh_metrics()
-        ready = bool(self.pdf_path and self.names and self.rect_info and self.output_dir)
+        ready = bool(self.available_fonts and self.pdf_path and self.names and self.rect_info and self.output_dir)
         if ready:
             self.start_button.state(["!disabled"])
             self.progress_status.set("Ready to review and export")
-            print("[DEBUG] Ready state: ENABLED (pdf=%s names=%s rect=%s)" % (bool(self.pdf_path), bool(self.names), bool(self.rect_info)))
+            log.debug("Ready state: ENABLED (pdf=%s names=%s rect=%s)", bool(self.pdf_path), bool(self.names), bool(self.rect_info))
         else:
             missing = []
+            if not self.available_fonts:
+                missing.append("font")
             if not self.pdf_path:
                 missing.append("template PDF")
             if not self.names:
@@ -843,8 +1122,9 @@ class CertificateApp:
                 missing.append("output folder")
             self.start_button.state(["disabled"])
             self.progress_status.set(f"Waiting: select {', '.join(missing)}")
-            print("[DEBUG] Ready state: DISABLED missing=%s" % missing)
+            log.debug("Ready state: DISABLED missing=%s", missing)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
     CertificateApp()
@@ -1,18 +1,18 @@
-import io
 import os
-import re
+import queue
 import tkinter as tk
+from collections import deque
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from typing import Dict, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
 from PIL import Image, ImageDraw, ImageTk
 import fitz  # PyMuPDF
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.pdfmetrics import stringWidth
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
-from PyPDF2 import PdfReader, PdfWriter
+
+from certificate_renderer import CertificateEntry, ensure_font_registered, init_worker, write_certificates
 
 
 THEMES = {
@@ -43,10 +43,47 @@ THEMES = {
 }
 
 FONT_FAMILY = "Segoe UI"
+PREVIEW_MAX_SIZE = 620
+# Upper bound for the area-selection raster; it is also kept within the screen
+MAX_RASTER_WIDTH = 1200
+MAX_RASTER_HEIGHT = 900
+COMBINED_FILENAME = "certificates.pdf"
+# Characters Windows forbids in file names, each mapped to an underscore
+FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+LOG_MAX_LINES = 500
+LOG_FLUSH_MS = 200
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[\\/:\*\?\"<>\|]", "_", name)
+    return name.translate(FILENAME_TRANSLATION)
+
+
+@lru_cache(maxsize=None)
+def advance_table(font_name: str) -> Tuple[float, ...]:
+    """Advance widths at size 1000 for code points 0-255 of a registered TTF font."""
+
+    face = pdfmetrics.getFont(font_name).face
+    return tuple(face.charWidths.get(code, face.defaultWidth) for code in range(256))
+
+
+@lru_cache(maxsize=None)
+def advance_map(font_name: str) -> Tuple[Dict[str, float], float]:
+    """Advance widths at size 1000 keyed by character for every glyph in the font, plus its default width."""
+
+    face = pdfmetrics.getFont(font_name).face
+    return {chr(code): width for code, width in face.charWidths.items()}, face.defaultWidth
+
+
+def fast_string_width(text: str, font_name: str, size: float) -> float:
+    """stringWidth without ReportLab's per-call dispatch: a table gather for Latin-1, a dict lookup otherwise."""
+
+    try:
+        encoded = text.encode("latin-1")
+    except UnicodeEncodeError:
+        widths, default = advance_map(font_name)
+        lookup = widths.get
+        return sum([lookup(char, default) for char in text]) * size / 1000.0
+    return sum(map(advance_table(font_name).__getitem__, encoded)) * size / 1000.0
 
 
 def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
@@ -58,6 +95,8 @@ def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
     style.configure("Heading.TLabel", background=palette["card"], foreground=palette["text"], font=(FONT_FAMILY, 14, "bold"))
     style.configure("Emphasis.TLabel", background=palette["card"], foreground=palette["accent"], font=(FONT_FAMILY, 11, "bold"))
     style.configure("Status.TLabel", background=palette["card"], foreground=palette["muted"], font=(FONT_FAMILY, 10))
+    style.configure("Card.TCheckbutton", background=palette["card"], foreground=palette["text"], font=(FONT_FAMILY, 11))
+    style.map("Card.TCheckbutton", background=[("active", palette["card"])])
 
     style.configure("Title.TLabel", background=palette["bg"], foreground=palette["text"], font=(FONT_FAMILY, 24, "bold"))
     style.configure("Subtitle.TLabel", background=palette["bg"], foreground=palette["muted"], font=(FONT_FAMILY, 11))
@@ -89,6 +128,8 @@ def build_style(root: tk.Tk, palette: Dict[str, str]) -> None:
     root.option_add("*TCombobox*Listbox*Font", (FONT_FAMILY, 11))
     root.option_add("*TCombobox*Listbox*Background", palette["card"])
     root.option_add("*TCombobox*Listbox*Foreground", palette["text"])
+    root.option_add("*TCombobox*Listbox*selectBackground", palette["accent"])
+    root.option_add("*TCombobox*Listbox*selectForeground", palette["bg"])
 
 
 class AutoCertificateApp:
@@ -102,20 +143,37 @@ class AutoCertificateApp:
         self.root.configure(bg=self.palette["bg"])
         self.root.minsize(920, 640)
 
-        self.available_fonts = self.load_fonts()
-        self.selected_font = tk.StringVar(value=next(iter(self.available_fonts)))
+        # Fonts are discovered on a background thread so the window appears straight away.
+        self.available_fonts: Dict[str, str] = {}
+        self.selected_font = tk.StringVar(value="")
+        font_executor = ThreadPoolExecutor(max_workers=1)
+        self.font_scan: Optional[Future] = font_executor.submit(self.load_fonts)
+        font_executor.shutdown(wait=False)
 
         self.pdf_path: Optional[str] = None
         self.names_path: Optional[str] = None
         self.names: list[str] = []
-        self.template_pdf_bytes: Optional[bytes] = None
-
-        self.pix: Optional[fitz.Pixmap] = None
+        # (status label, log detail, future) for every job of the current run
+        self.generation_jobs: List[Tuple[str, str, Future]] = []
+        # Jobs land here from their done-callbacks, so polling only touches what actually finished
+        self.generation_finished: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self.generation_total = 0
+        self.generation_done = 0
+        self.generation_failed = 0
+
+        # Template page size in PDF points; placement math uses this rather than any raster
+        self.page_size: Tuple[float, float] = (0.0, 0.0)
         self.img: Optional[Image.Image] = None
+        # Pixels per PDF point of self.img, which is fitted to the screen for the area selection
+        self.raster_scale: float = 1.0
+        # Downscaled template for the side preview, and its scale relative to self.img
+        self.preview_base: Optional[Image.Image] = None
+        self.preview_scale: float = 1.0
         self.rect_info: Optional[dict] = None
         self.preview_photo: Optional[ImageTk.PhotoImage] = None
 
         self.output_dir: str = self.default_output_dir()
+        self.combine_output = tk.BooleanVar(value=False)
 
         self.pdf_status = tk.StringVar(value="No template selected")
         self.names_status = tk.StringVar(value="No names file selected")
@@ -128,13 +186,20 @@ class AutoCertificateApp:
 
         self.progress_bar: Optional[ttk.Progressbar] = None
         self.log_text: Optional[tk.Text] = None
+        # Log lines waiting for the next flush; older entries fall off rather than piling up
+        self.log_buffer: Deque[str] = deque(maxlen=LOG_MAX_LINES)
+        self.log_flush_pending = False
         self.preview_label: Optional[tk.Label] = None
+        # Plain Tk widgets with palette colours, as (widget, {option: palette key}), recoloured on theme changes
+        self.themed_widgets: List[Tuple[tk.Widget, Dict[str, str]]] = []
 
         build_style(self.root, self.palette)
         self.update_theme_button_label()
         self.build_layout()
         self.refresh_metrics()
+        self.root.after(50, self.poll_font_scan)
         self.root.mainloop()
+        wait([future for _, _, future in self.generation_jobs])
 
     def update_theme_button_label(self) -> None:
         target = "Light" if self.theme_name.get() == "dark" else "Dark"
@@ -155,10 +220,23 @@ class AutoCertificateApp:
     def append_log(self, message: str) -> None:
         if not self.log_text:
             return
-        self.log_text.insert("end", message + "\n")
+        self.log_buffer.append(message)
+        if not self.log_flush_pending:
+            self.log_flush_pending = True
+            self.root.after(LOG_FLUSH_MS, self.flush_log)
+
+    def flush_log(self) -> None:
+        self.log_flush_pending = False
+        if not self.log_text or not self.log_buffer:
+            return
+        self.log_text.insert("end", "\n".join(self.log_buffer) + "\n")
+        self.log_buffer.clear()
+        # Keep only the most recent lines so long runs don't grow the widget without bound
+        self.log_text.delete("1.0", f"end - {LOG_MAX_LINES + 1} lines")
         self.log_text.see("end")
 
     def clear_log(self) -> None:
+        self.log_buffer.clear()
         if self.log_text:
             self.log_text.delete("1.0", "end")
 
@@ -169,47 +247,58 @@ class AutoCertificateApp:
             self.preview_label.configure(image="", text="Load a template to see a preview", anchor="center", fg=self.palette["muted"], bg=self.palette["card"])
             return
 
-        preview_scale = min(620 / max(1, self.img.width), 620 / max(1, self.img.height), 1.0)
-        render_img = self.img.copy()
+        render_img = self.preview_base.copy()
 
         if self.rect_info:
+            preview_scale = self.preview_scale
             draw = ImageDraw.Draw(render_img)
             draw.rectangle(
                 [
-                    int(self.rect_info["tk_left"]),
-                    int(self.rect_info["tk_top"]),
-                    int(self.rect_info["tk_right"]),
-                    int(self.rect_info["tk_bottom"]),
+                    int(self.rect_info["tk_left"] * preview_scale),
+                    int(self.rect_info["tk_top"] * preview_scale),
+                    int(self.rect_info["tk_right"] * preview_scale),
+                    int(self.rect_info["tk_bottom"] * preview_scale),
                 ],
                 outline=self.palette["accent"],
                 width=3,
             )
 
-        if abs(preview_scale - 1.0) > 1e-6:
-            scaled_w = int(self.img.width * preview_scale)
-            scaled_h = int(self.img.height * preview_scale)
-            render_img = render_img.resize((scaled_w, scaled_h), Image.LANCZOS)
-
-        self.preview_photo = ImageTk.PhotoImage(render_img)
+        # Same-sized previews are pasted into the existing Tk image instead of allocating a new one.
+        if self.preview_photo is not None and (self.preview_photo.width(), self.preview_photo.height()) == render_img.size:
+            self.preview_photo.paste(render_img)
+        else:
+            self.preview_photo = ImageTk.PhotoImage(render_img)
         self.preview_label.configure(image=self.preview_photo, text="")
-        self.preview_label.image = self.preview_photo
 
     def toggle_theme(self) -> None:
         new_theme = "light" if self.theme_name.get() == "dark" else "dark"
         self.theme_name.set(new_theme)
         self.palette = THEMES[new_theme]
         self.update_theme_button_label()
-        self.rebuild_ui()
+        self.apply_theme()
+
+    def apply_theme(self) -> None:
+        """Recolour the existing widgets in place; ttk widgets follow their restyled styles."""
 
-    def rebuild_ui(self) -> None:
-        for child in self.root.winfo_children():
-            child.destroy()
         build_style(self.root, self.palette)
-        self.build_layout()
-        self.refresh_metrics()
-        self.update_ready_state()
+        self.root.configure(bg=self.palette["bg"])
+        for widget, options in self.themed_widgets:
+            widget.configure(**{option: self.palette[key] for option, key in options.items()})
+        # The option database only reaches popdowns created later; one that was already opened keeps its colours.
+        popdown = self.root.tk.call("ttk::combobox::PopdownWindow", self.font_selector)
+        self.root.tk.call(
+            f"{popdown}.f.l",
+            "configure",
+            "-background", self.palette["card"],
+            "-foreground", self.palette["text"],
+            "-selectbackground", self.palette["accent"],
+            "-selectforeground", self.palette["bg"],
+        )
+        self.update_preview_snapshot()
 
     def load_fonts(self) -> Dict[str, str]:
+        """Find every font under fonts/ without parsing it. Runs on the font-scan thread, so it must not touch Tk."""
+
         fonts_dir = os.path.join(os.path.dirname(__file__), "fonts")
         available_fonts: Dict[str, str] = {}
 
@@ -222,17 +311,51 @@ class AutoCertificateApp:
                 if font_file.lower().endswith((".ttf", ".otf")):
                     font_path = os.path.join(root_dir, font_file)
                     font_label = f"{family}/{os.path.splitext(font_file)[0]}" if family != "fonts" else os.path.splitext(font_file)[0]
-                    try:
-                        pdfmetrics.registerFont(TTFont(font_label, font_path))
-                        available_fonts[font_label] = font_path
-                    except Exception as exc:
-                        print(f"Warning: Could not register font '{font_label}' at {font_path}: {exc}")
+                    available_fonts[font_label] = font_path
+
+        return available_fonts
 
+    def poll_font_scan(self) -> None:
+        """Hand the fonts found by the background scan to the UI once it finishes."""
+
+        if not self.font_scan.done():
+            self.root.after(50, self.poll_font_scan)
+            return
+        try:
+            available_fonts = self.font_scan.result()
+        except Exception as exc:
+            # An unreadable fonts directory leaves the app just as unusable as an empty one.
+            messagebox.showerror("Font Error", f"Could not scan the 'fonts' directory.\n{exc}")
+            self.root.destroy()
+            return
+        finally:
+            self.font_scan = None
         if not available_fonts:
             messagebox.showerror("Font Error", "No fonts found in the 'fonts' directory. Add .ttf or .otf files and restart.")
-            raise SystemExit(1)
+            self.root.destroy()
+            return
 
-        return available_fonts
+        self.available_fonts = available_fonts
+        self.font_selector.configure(values=list(available_fonts.keys()))
+        self.selected_font.set(next(iter(available_fonts)))
+        self.update_ready_state()
+
+    def register_selected_font(self) -> bool:
+        """Parse the chosen font on first use; an unreadable font is dropped from the list."""
+
+        font_label = self.selected_font.get()
+        font_path = self.available_fonts[font_label]
+        try:
+            ensure_font_registered(font_label, font_path)
+            return True
+        except Exception as exc:
+            self.append_log(f"✗ Could not register font '{font_label}' at {font_path} — {exc}")
+            del self.available_fonts[font_label]
+            self.font_selector.configure(values=list(self.available_fonts.keys()))
+            self.selected_font.set(next(iter(self.available_fonts), ""))
+            messagebox.showerror("Font Error", f"Could not load the font '{font_label}'. Choose another one.\n{exc}")
+            self.update_ready_state()
+            return False
 
     def build_layout(self) -> None:
         self.root.configure(bg=self.palette["bg"])
@@ -241,6 +364,7 @@ class AutoCertificateApp:
         container.pack(fill="both", expand=True)
 
         canvas = tk.Canvas(container, bg=self.palette["bg"], highlightthickness=0, borderwidth=0)
+        self.themed_widgets.append((canvas, {"bg": "bg"}))
         v_scroll = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         canvas.configure(yscrollcommand=v_scroll.set)
         canvas.pack(side="left", fill="both", expand=True)
@@ -316,6 +440,7 @@ class AutoCertificateApp:
         ttk.Separator(preview_card).grid(row=1, column=0, sticky="ew", pady=(8, 12))
 
         self.preview_label = tk.Label(preview_card, bg=self.palette["card"], bd=1, relief="solid")
+        self.themed_widgets.append((self.preview_label, {"bg": "card"}))
         self.preview_label.grid(row=2, column=0, sticky="nsew")
         preview_card.rowconfigure(2, weight=1)
         ttk.Label(
@@ -353,6 +478,7 @@ class AutoCertificateApp:
         )
 
         self.log_text = tk.Text(progress_card, height=10, wrap="word", bg=self.palette["card"], fg=self.palette["text"], bd=1, relief="solid")
+        self.themed_widgets.append((self.log_text, {"bg": "card", "fg": "text"}))
         self.log_text.grid(row=7, column=0, sticky="nsew", pady=(10, 0))
         self.log_text.configure(state="normal")
         progress_card.rowconfigure(7, weight=1)
@@ -383,6 +509,7 @@ class AutoCertificateApp:
             state="readonly",
         )
         self.font_selector.grid(row=1, column=1, sticky="ew", padx=(10, 0))
+        self.font_selector.bind("<<ComboboxSelected>>", lambda _: self.register_selected_font())
         ttk.Label(
             font_section,
             text="Drop new .ttf/.otf files into the fonts/ folder to expand this list instantly.",
@@ -403,6 +530,12 @@ class AutoCertificateApp:
         ttk.Label(output_section, text="4. Output", style="Emphasis.TLabel").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 6))
         ttk.Button(output_section, text="Choose output folder", command=self.choose_output_dir).grid(row=1, column=0, padx=(0, 12), pady=4)
         ttk.Label(output_section, textvariable=self.output_status, style="Card.TLabel", wraplength=420).grid(row=1, column=1, sticky="w")
+        ttk.Checkbutton(
+            output_section,
+            text=f"Combine all certificates into one PDF ({COMBINED_FILENAME})",
+            variable=self.combine_output,
+            style="Card.TCheckbutton",
+        ).grid(row=2, column=0, columnspan=2, sticky="w", pady=(6, 0))
 
         review_section = ttk.Frame(container, style="Card.TFrame")
         review_section.grid(row=5, column=0, sticky="ew", pady=(18, 0))
@@ -426,7 +559,7 @@ class AutoCertificateApp:
         self.pdf_path = path
         self.area_status.set("Area not selected")
         self.rect_info = None
-        self.pdf_status.set(f"Template: {os.path.basename(path)} ({self.pix.width} x {self.pix.height}px)")
+        self.pdf_status.set(f"Template: {os.path.basename(path)} ({int(self.page_size[0])} x {int(self.page_size[1])}px)")
         self.refresh_metrics()
         self.update_ready_state()
         self.append_log(f"Loaded template: {os.path.basename(path)}")
@@ -437,8 +570,9 @@ class AutoCertificateApp:
         if not path:
             return
 
-        with open(path, "r", encoding="utf-8") as handle:
-            names = [line.strip() for line in handle.readlines() if line.strip()]
+        with open(path, "r", encoding="utf-8-sig") as handle:
+            # Stream the file once; each line is stripped a single time.
+            names = [name for name in (line.strip() for line in handle) if name]
 
         if not names:
             messagebox.showwarning("Names", "The selected file has no names.")
@@ -465,8 +599,23 @@ class AutoCertificateApp:
         try:
             doc = fitz.open(path)
             page = doc.load_page(0)
-            self.pix = page.get_pixmap()
-            self.img = Image.frombytes("RGB", [self.pix.width, self.pix.height], self.pix.samples)
+            # Never rasterize beyond what the selection dialog can show on screen.
+            max_width = min(MAX_RASTER_WIDTH, self.root.winfo_screenwidth() - 100)
+            max_height = min(MAX_RASTER_HEIGHT, self.root.winfo_screenheight() - 260)
+            raster_scale = min(1.0, max_width / max(1, page.rect.width), max_height / max(1, page.rect.height))
+            # frombytes copies the samples, so neither pixmap needs to outlive this method.
+            pix = page.get_pixmap(matrix=fitz.Matrix(raster_scale, raster_scale), alpha=False)
+            self.img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            self.raster_scale = raster_scale
+            self.page_size = (page.rect.width, page.rect.height)
+            # MuPDF renders the side preview at its display size directly, so nothing is resized per template.
+            preview_zoom = min(PREVIEW_MAX_SIZE / max(1, page.rect.width), PREVIEW_MAX_SIZE / max(1, page.rect.height), 1.0)
+            self.preview_scale = preview_zoom / raster_scale
+            if abs(self.preview_scale - 1.0) > 1e-6:
+                preview_pix = page.get_pixmap(matrix=fitz.Matrix(preview_zoom, preview_zoom), alpha=False)
+                self.preview_base = Image.frombytes("RGB", [preview_pix.width, preview_pix.height], preview_pix.samples)
+            else:
+                self.preview_base = self.img
             return True
         except Exception as exc:
             messagebox.showerror("PDF Error", f"Unable to open the template.\n{exc}")
@@ -476,13 +625,15 @@ class AutoCertificateApp:
                 doc.close()
             except Exception:
                 pass
+            # Release whatever MuPDF cached while rendering the template.
+            fitz.TOOLS.store_shrink(100)
 
     def select_area(self) -> None:
-        if not self.pix or not self.img:
+        if not self.img:
             messagebox.showinfo("Template required", "Choose a template PDF first.")
             return
 
-        rect_start, rect_end = self.show_rectangle_selection(self.img, self.pix)
+        rect_start, rect_end = self.show_rectangle_selection(self.img)
         if not rect_start or not rect_end:
             self.area_status.set("Area not selected — draw a rectangle and confirm")
             self.refresh_metrics()
@@ -497,7 +648,7 @@ class AutoCertificateApp:
 
         norm_start = (int(rect_start[0]), int(rect_start[1]))
         norm_end = (int(rect_end[0]), int(rect_end[1]))
-        self.rect_info = self.calculate_rect(norm_start, norm_end, self.pix.height)
+        self.rect_info = self.calculate_rect(norm_start, norm_end, self.page_size[1], self.raster_scale)
         rect_width = int(self.rect_info["rect_width"])
         rect_height = int(self.rect_info["rect_height"])
         self.area_status.set(f"Selected area: {rect_width} x {rect_height} px")
@@ -511,38 +662,116 @@ class AutoCertificateApp:
             messagebox.showinfo("Missing info", "Please finish selecting files, font, area, and output folder first.")
             return
 
+        if not self.register_selected_font():
+            return
         os.makedirs(self.output_dir, exist_ok=True)
 
         self.clear_log()
-        if self.progress_bar:
-            self.progress_bar.configure(maximum=max(1, len(self.names)))
-            self.progress_bar['value'] = 0
         self.progress_status.set("Generating certificates…")
-        self.root.update_idletasks()
-
-        with open(self.pdf_path, "rb") as template_file:
-            self.template_pdf_bytes = template_file.read()
-
-        for idx, name in enumerate(self.names, start=1):
-            font_size = self.calculate_initial_font_size(name, self.selected_font.get())
-            text_width = stringWidth(name, self.selected_font.get(), font_size)
-            x_text = self.rect_info["x_left"] + (self.rect_info["rect_width"] - text_width) / 2
-            y_text = self.rect_info["y_bottom"] + (self.rect_info["rect_height"] - font_size) / 2
-            self.generate_certificate(name, self.selected_font.get(), font_size, x_text, y_text)
-            self.progress_status.set(f"Saved {idx}/{len(self.names)}: {name}")
+
+        font_label = self.selected_font.get()
+        font_path = self.available_fonts[font_label]
+        # Workers open the template from its path in their initializer, so it is read as it is now on disk
+        # and no copy of it is pickled into each process.
+        combine = self.combine_output.get()
+        pool = ProcessPoolExecutor(
+            max_workers=1 if combine else min(len(self.names), os.cpu_count() or 1),
+            initializer=init_worker,
+            initargs=(self.pdf_path,),
+        )
+        # Each name is measured once at size 1; its fitted size and centred position follow from that.
+        x_left, y_bottom = self.rect_info["x_left"], self.rect_info["y_bottom"]
+        rect_width, rect_height = self.rect_info["rect_width"], self.rect_info["rect_height"]
+        entries: List[CertificateEntry] = []
+        for name in self.names:
+            width_at_1 = fast_string_width(name, font_label, 1)
+            font_size = self.calculate_initial_font_size(width_at_1)
+            x_text = x_left + (rect_width - width_at_1 * font_size) * 0.5
+            y_text = y_bottom + (rect_height - font_size) * 0.5
+            entries.append((name, font_label, font_path, font_size, x_text, y_text))
+
+        self.generation_jobs = []
+        self.generation_done = 0
+        self.generation_failed = 0
+        if combine:
+            output_filename = os.path.join(self.output_dir, COMBINED_FILENAME)
+            future = pool.submit(write_certificates, output_filename, entries, self.page_size)
+            self.track_generation_job(COMBINED_FILENAME, f"{len(entries)} certificates, font {font_label}", future)
+        else:
+            used_names: Set[str] = set()
+            for entry in entries:
+                name, font_size = entry[0], entry[3]
+                # Names that sanitize to the same file would overwrite each other from different workers.
+                stem = f"certificate_{sanitize_filename(name)}"
+                file_name, suffix = f"{stem}.pdf", 2
+                while file_name.lower() in used_names:
+                    file_name, suffix = f"{stem}_{suffix}.pdf", suffix + 1
+                used_names.add(file_name.lower())
+                output_filename = os.path.join(self.output_dir, file_name)
+                future = pool.submit(write_certificates, output_filename, [entry], self.page_size)
+                self.track_generation_job(name, f"font {font_label} @ {font_size}pt", future)
+        # Queued jobs still run; the pool just releases its workers once they are done.
+        pool.shutdown(wait=False)
+
+        self.generation_total = len(self.generation_jobs)
+        if self.progress_bar:
+            self.progress_bar.configure(maximum=max(1, self.generation_total))
+            self.progress_bar["value"] = 0
+
+        self.start_button.state(["disabled"])
+        self.root.after(50, self.poll_generation)
+
+    def track_generation_job(self, label: str, detail: str, future: Future) -> None:
+        self.generation_jobs.append((label, detail, future))
+        # Runs on the executor's thread; the queue hands the job back to the Tk side.
+        future.add_done_callback(lambda done: self.generation_finished.put((label, detail, done)))
+
+    def poll_generation(self) -> None:
+        """Report finished certificates without blocking the Tk event loop."""
+
+        log_lines: List[str] = []
+        last_label = None
+        while True:
+            try:
+                label, detail, future = self.generation_finished.get_nowait()
+            except queue.Empty:
+                break
+            self.generation_done += 1
+            last_label = label
+            if future.exception() is not None:
+                self.generation_failed += 1
+                log_lines.append(f"✗ {label} — {future.exception()}")
+            else:
+                log_lines.append(f"✓ {label} — {detail}")
+
+        # Touch the widgets once per tick, however many certificates finished since the last one.
+        if log_lines:
+            self.append_log("\n".join(log_lines))
+            self.progress_status.set(f"Saved {self.generation_done}/{self.generation_total}: {last_label}")
             if self.progress_bar:
-                self.progress_bar['value'] = idx
-            self.append_log(f"✓ {name} — font {self.selected_font.get()} @ {font_size}pt")
-            self.root.update_idletasks()
+                self.progress_bar["value"] = self.generation_done
 
+        if self.generation_done < self.generation_total:
+            self.root.after(50, self.poll_generation)
+            return
+        self.generation_jobs = []
+        self.update_ready_state()
+        if self.generation_failed:
+            summary = f"{self.generation_failed} of {self.generation_total} certificates failed"
+            self.progress_status.set(f"{summary}; see the log for details.")
+            self.append_log(f"Finished with errors: {summary}.")
+            messagebox.showerror("Generation Error", f"{summary}.\nThe log lists each failed name and its error.")
+            return
         self.progress_status.set("All certificates generated automatically!")
         self.append_log("Completed all certificates.")
 
-    def calculate_rect(self, rect_start: Tuple[int, int], rect_end: Tuple[int, int], pix_height: int) -> dict:
+    def calculate_rect(
+        self, rect_start: Tuple[int, int], rect_end: Tuple[int, int], page_height: float, raster_scale: float
+    ) -> dict:
         x1, y1 = rect_start
         x2, y2 = rect_end
-        pdf_x1, pdf_y1 = x1, pix_height - y1
-        pdf_x2, pdf_y2 = x2, pix_height - y2
+        pdf_x1, pdf_y1 = x1 / raster_scale, page_height - y1 / raster_scale
+        pdf_x2, pdf_y2 = x2 / raster_scale, page_height - y2 / raster_scale
 
         rect_width = abs(pdf_x2 - pdf_x1)
         rect_height = abs(pdf_y2 - pdf_y1)
@@ -560,47 +789,26 @@ class AutoCertificateApp:
             "tk_bottom": max(y1, y2),
         }
 
-    def calculate_initial_font_size(self, text_value: str, selected_font: str) -> int:
+    def calculate_initial_font_size(self, width_at_1: float) -> int:
+        """Largest font size that fits the selected rectangle, given the text's width at size 1."""
+
+        # Text width is linear in the font size, so one measurement gives the best fit directly.
         max_size = int(min(self.rect_info["rect_height"], 120)) or 5
-        size = max_size
-        while size >= 5:
-            text_width = stringWidth(text_value, selected_font, size)
-            if text_width <= self.rect_info["rect_width"] and size <= self.rect_info["rect_height"]:
-                return size
-            size -= 1
-        return 5
-
-    def generate_certificate(self, name_text: str, font_choice: str, font_size: int, pdf_x: float, pdf_y: float) -> None:
-        packet = io.BytesIO()
-        c = canvas.Canvas(packet, pagesize=(self.pix.width, self.pix.height))
-        c.setFont(font_choice, font_size)
-        c.setFillColorRGB(1, 1, 1)
-        c.drawString(pdf_x, pdf_y, name_text)
-        c.save()
-
-        packet.seek(0)
-        template_reader = PdfReader(io.BytesIO(self.template_pdf_bytes))
-        overlay_reader = PdfReader(packet)
-        writer = PdfWriter()
-
-        base_page = template_reader.pages[0]
-        base_page.merge_page(overlay_reader.pages[0])
-        writer.add_page(base_page)
-
-        output_filename = os.path.join(self.output_dir, f"certificate_{sanitize_filename(name_text)}.pdf")
-        with open(output_filename, "wb") as out_file:
-            writer.write(out_file)
-
-    def show_rectangle_selection(self, img: Image.Image, pix: fitz.Pixmap) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        size = min(max_size, int(self.rect_info["rect_width"] / width_at_1)) if width_at_1 > 0 else max_size
+        return max(5, size)
+
+    def show_rectangle_selection(self, img: Image.Image) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
         selection = {"start": None, "end": None, "coords": None}
         rect_id = None
+        # Latest pointer position while dragging; the rectangle follows it once per idle pass
+        drag = {"pointer": None, "pending": False}
 
         win = tk.Toplevel(self.root)
         win.title("Mark name placement area")
         win.configure(bg=self.palette["card"])
 
-        window_width = min(pix.width + 60, win.winfo_screenwidth() - 40)
-        window_height = min(pix.height + 180, win.winfo_screenheight() - 80)
+        window_width = min(img.width + 60, win.winfo_screenwidth() - 40)
+        window_height = min(img.height + 180, win.winfo_screenheight() - 80)
         win.geometry(f"{window_width}x{window_height}")
         win.resizable(False, False)
 
@@ -614,8 +822,8 @@ class AutoCertificateApp:
 
         canvas_widget = tk.Canvas(
             win,
-            width=pix.width,
-            height=pix.height,
+            width=img.width,
+            height=img.height,
             bg="#0b1220",
             highlightthickness=2,
             highlightbackground=self.palette["outline"],
@@ -631,16 +839,26 @@ class AutoCertificateApp:
         def on_mouse_down(event):
             nonlocal rect_id
             selection["start"] = (event.x, event.y)
+            drag["pointer"] = None
             rect_id = canvas_widget.create_rectangle(event.x, event.y, event.x, event.y, outline=self.palette["accent"], width=2)
 
         def on_mouse_move(event):
-            nonlocal rect_id
-            if rect_id:
-                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], event.x, event.y)
+            drag["pointer"] = (event.x, event.y)
+            if rect_id and not drag["pending"]:
+                drag["pending"] = True
+                canvas_widget.after_idle(flush_drag)
+
+        def flush_drag():
+            drag["pending"] = False
+            if rect_id and drag["pointer"] and canvas_widget.winfo_exists():
+                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], *drag["pointer"])
 
         def on_mouse_up(event):
             selection["end"] = (event.x, event.y)
+            # A flush still queued from the drag must not move the rectangle back to an older motion point.
+            drag["pointer"] = None
             if rect_id:
+                canvas_widget.coords(rect_id, selection["start"][0], selection["start"][1], event.x, event.y)
                 selection["coords"] = canvas_widget.coords(rect_id)
             helper.configure(text=f"Selected from {selection['start']} to {selection['end']}. Click Confirm selection.")
             confirm_btn.state(["!disabled"])
@@ -678,12 +896,16 @@ class AutoCertificateApp:
 
     def update_ready_state(self) -> None:
         self.refresh_metrics()
-        ready = bool(self.pdf_path and self.names and self.rect_info and self.output_dir)
-        if ready:
+        ready = bool(self.available_fonts and self.pdf_path and self.names and self.rect_info and self.output_dir)
+        if self.generation_jobs:
+            self.start_button.state(["disabled"])
+        elif ready:
             self.start_button.state(["!disabled"])
             self.progress_status.set("Ready to generate automatically")
         else:
             missing = []
+            if not self.available_fonts:
+                missing.append("a font (still loading)")
             if not self.pdf_path:
                 missing.append("template PDF")
             if not self.names:
@@ -0,0 +1,83 @@
+import io
+from typing import List, Optional, Set, Tuple
+
+import fitz  # PyMuPDF
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+
+# (name, font label, font path, font size, x, y) with the position in PDF points from the bottom-left corner
+CertificateEntry = Tuple[str, str, str, int, float, float]
+
+# Labels already registered with ReportLab in this process; fonts are parsed only once they are used.
+_REGISTERED_FONTS: Set[str] = set()
+
+
+def ensure_font_registered(font_label: str, font_path: str) -> None:
+    if font_label not in _REGISTERED_FONTS:
+        pdfmetrics.registerFont(TTFont(font_label, font_path))
+        _REGISTERED_FONTS.add(font_label)
+
+
+# Certificates are rendered in worker processes; each one opens the template file itself, once, in its
+# initializer. Only the path crosses the process boundary, and the OS page cache backs every worker's reads.
+_worker_template: Optional[fitz.Document] = None
+# One overlay buffer per worker, rewound for every job instead of reallocated.
+_overlay_buffer = io.BytesIO()
+
+
+def init_worker(template_path: str) -> None:
+    global _worker_template
+    _worker_template = fitz.open(template_path)
+
+
+def draw_overlay(entries: List[CertificateEntry], page_size: Tuple[float, float]) -> fitz.Document:
+    """Draw each entry's name in white on its own page of one ReportLab overlay."""
+
+    _overlay_buffer.seek(0)
+    _overlay_buffer.truncate()
+    c = canvas.Canvas(_overlay_buffer, pagesize=page_size)
+    for name_text, font_label, font_path, font_size, pdf_x, pdf_y in entries:
+        ensure_font_registered(font_label, font_path)
+        c.setFont(font_label, font_size)
+        c.setFillColorRGB(1, 1, 1)
+        c.drawString(pdf_x, pdf_y, name_text)
+        c.showPage()
+    c.save()
+    return fitz.open("pdf", _overlay_buffer.getvalue())
+
+
+def write_certificates(output_filename: str, entries: List[CertificateEntry], page_size: Tuple[float, float]) -> None:
+    """Write one certificate page per entry to output_filename, stamped onto the worker's template.
+
+    The template page is copied with insert_pdf, so its links and annotations come along, and MuPDF
+    places the overlay as a form XObject instead of re-parsing and rewriting the template's content
+    streams. For several entries every copy of the page points back at the first page's content
+    stream, and one overlay (with one font subset) holds all the names, so each extra certificate
+    adds only a few hundred bytes plus its own annotations.
+    """
+
+    overlay = draw_overlay(entries, page_size)
+    doc = fitz.open()
+    try:
+        doc.insert_pdf(_worker_template, from_page=0, to_page=0)
+        if len(entries) == 1:
+            doc[0].show_pdf_page(doc[0].rect, overlay, 0)
+            pdf_bytes = doc.tobytes(deflate=True)
+        else:
+            template_contents = doc.xref_get_key(doc[0].xref, "Contents")[1]
+            for _ in range(1, len(entries)):
+                doc.fullcopy_page(0)
+            for index, page in enumerate(doc):
+                if index:
+                    # The duplicated content streams are left unreferenced and dropped by garbage collection.
+                    doc.xref_set_key(page.xref, "Contents", template_contents)
+                page.show_pdf_page(page.rect, overlay, index)
+            pdf_bytes = doc.tobytes(garbage=3, deflate=True)
+    finally:
+        doc.close()
+        overlay.close()
+    # Serialize in memory and hand the file system a single write.
+    with open(output_filename, "wb") as output_file:
+        output_file.write(pdf_bytes)
@@ -1,20 +1,19 @@
 input_file = "pdf_automation/participant_names.txt"
 output_file = "pdf_automation/participant_names_cleaned.txt"
 
-with open(input_file, "r", encoding="utf-8") as f:
-    lines = f.readlines()
-
 # Remove leading numbers and dots, strip whitespace
+# Lines are streamed from the file rather than read into a list first
 names = []
-for line in lines:
-    # Remove leading number and dot (e.g., "1. Name")
-    name = line.strip()
-    if name:
-        # Split at first space after the dot
-        parts = name.split('. ', 1)
-        if len(parts) == 2:
-            name = parts[1]
-        names.append(name)
+with open(input_file, "r", encoding="utf-8-sig") as f:
+    for line in f:
+        # Remove leading number and dot (e.g., "1. Name")
+        name = line.strip()
+        if name:
+            # Split at first space after the dot, but only drop a numeric prefix (keeps "Dr. Smith")
+            number, sep, rest = name.partition('. ')
+            if sep and number.isdigit():
+                name = rest
+            names.append(name)
 
 # Sort by length (shortest to longest)
 names_sorted = sorted(names, key=len)